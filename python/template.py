@@ -4,6 +4,9 @@ Avatar Processing Service - Coding Challenge Template (Simplified)
 Choose your preferred language and adapt this structure accordingly.
 This Python template can be converted to Go, Java, TypeScript, etc.
 
+Requires Python 3.10+ (the dataclasses use slots=True). Slotted instances
+reject ad-hoc attributes, so declare any extra job fields on the dataclass.
+
 Mock LLM API Endpoint:
 POST /api/v1/moderate-content
 Headers: Authorization: Bearer <token>
@@ -22,13 +25,13 @@ from dataclasses import dataclass
 from typing import Optional, Dict
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class ModerationResponse:
     is_approved: bool
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AvatarJob:
     id: str
     user_id: str
@@ -156,6 +159,8 @@ IMPLEMENTATION NOTES:
    - jobs = {}  # job_id -> AvatarJob
 
 2. HTTP Client: Use requests library or similar
+   - Create one requests.Session in __init__ and reuse it, so connections
+     are pooled instead of opening a new TCP/TLS connection per call
    - Set timeout (e.g., 5 seconds)
    - Handle basic HTTP errors
 
@@ -164,6 +169,15 @@ IMPLEMENTATION NOTES:
    - API returns error status
    - Network issues
    - Invalid response format
+   - Optional: retry transient failures (timeouts, 502/503/504) a few
+     times with exponential backoff, e.g. mount an HTTPAdapter with
+     Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+           allowed_methods=["POST"])
+     on the Session. POST must be opted in via allowed_methods; urllib3
+     does not retry it by default
+   - Once retries are exhausted on a forcelisted status, requests raises
+     requests.exceptions.RetryError (unless raise_on_status=False); catch
+     it and mark the job "failed"
 
 4. Job Flow:
    - Create job with "pending" status